@@ -0,0 +1,101 @@
+import heapq
+from collections import Counter, defaultdict
+
+
+class SearchIndex:
+    """N-gram index over item text that is updated in place as items change"""
+
+    GRAM_SIZE = 3
+    MAX_RANKED = 5000  # Larger candidate sets are returned in insertion order, unranked
+
+    def __init__(self):
+        self.texts = {}  # item id -> lowercased text
+        self.grams = defaultdict(set)  # trigram -> item ids containing it
+        self.prefixes = defaultdict(set)  # word prefix shorter than a trigram -> item ids
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __contains__(self, item_id):
+        return item_id in self.texts
+
+    def _grams(self, text):
+        size = self.GRAM_SIZE
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def _prefixes(self, text):
+        return {word[:size] for word in text.split()
+                for size in range(1, self.GRAM_SIZE)}
+
+    def add(self, item_id, text):
+        """Index a new item, replacing whatever was stored under the same id"""
+        self.remove(item_id)
+        text = text.lower()
+        self.texts[item_id] = text
+        for gram in self._grams(text):
+            self.grams[gram].add(item_id)
+        for prefix in self._prefixes(text):
+            self.prefixes[prefix].add(item_id)
+
+    def remove(self, item_id):
+        """Drop an item from the index, pruning keys that no longer match anything"""
+        text = self.texts.pop(item_id, None)
+        if text is None:
+            return
+        for table, keys in ((self.grams, self._grams(text)),
+                            (self.prefixes, self._prefixes(text))):
+            for key in keys:
+                postings = table[key]
+                postings.discard(item_id)
+                if not postings:
+                    del table[key]
+
+    def update(self, item_id, text):
+        """Re-index an edited item, skipping the work if its text did not change"""
+        if self.texts.get(item_id) != text.lower():
+            self.add(item_id, text)
+
+    def search(self, query, limit=200):
+        """Return up to `limit` item ids matching `query`, best match first"""
+        query = query.lower().strip()
+        if not query:
+            return []
+
+        hits = None
+        if len(query) < self.GRAM_SIZE:
+            # Too short for a trigram, match the start of any word instead
+            candidates = self.prefixes.get(query, set())
+        else:
+            grams = self._grams(query)
+            postings = sorted((self.grams.get(gram, set()) for gram in grams), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            if not candidates and len(grams) > 2:
+                # Nothing contains every trigram (likely a typo), so fall back
+                # to items sharing at least half of them, and never just one
+                counts = Counter()
+                for ids in postings:
+                    counts.update(ids)
+                needed = max(2, (len(grams) + 1) // 2)
+                hits = {item_id: count for item_id, count in counts.items()
+                        if count >= needed}
+                candidates = hits
+
+        if len(candidates) > self.MAX_RANKED:
+            # Too many to score, keep them in the order they were added
+            return heapq.nsmallest(limit, candidates)
+        return heapq.nsmallest(limit, candidates,
+                               key=lambda item_id: self._rank(query, item_id, hits))
+
+    def _rank(self, query, item_id, hits):
+        text = self.texts[item_id]
+        position = text.find(query)
+        if position == 0:
+            match = 0  # Whole item starts with the query
+        elif position > 0 and text[position - 1] == " ":
+            match = 1  # A word starts with the query
+        elif position > 0:
+            match = 2  # Query appears inside a word
+        else:
+            match = 3  # Only a fuzzy n-gram match
+        shared = -hits[item_id] if hits else 0
+        return (shared, match, len(text), item_id)
@@ -0,0 +1,79 @@
+from search_index import SearchIndex
+
+
+def make_index(*texts):
+    index = SearchIndex()
+    for item_id, text in enumerate(texts):
+        index.add(item_id, text)
+    return index
+
+
+def test_add_update_remove():
+    index = make_index("Iron Ore", "Coal")
+    assert len(index) == 2
+    assert index.search("iron") == [0]
+
+    index.update(0, "Copper Ore")
+    assert index.search("iron") == []
+    assert index.search("copper") == [0]
+
+    index.remove(0)
+    assert 0 not in index
+    assert index.search("ore") == []
+    index.remove(0)  # Removing twice is a no-op
+
+
+def test_remove_prunes_unused_keys():
+    index = make_index("sand")
+    index.remove(0)
+    assert not index.grams
+    assert not index.prefixes
+
+
+def test_shared_keys_survive_removing_one_item():
+    index = make_index("sand", "soulsand")
+    index.remove(1)
+    assert index.search("and") == [0]
+    assert index.search("s") == [0]
+
+
+def test_short_query_matches_word_prefixes():
+    index = make_index("sand", "soulsand", "red sand")
+    assert index.search("s") == [0, 1, 2]
+    assert index.search("so") == [1]
+    assert index.search("nd") == []  # Not the start of a word
+
+
+def test_ranks_prefix_then_word_start_then_substring():
+    index = make_index("quicksand", "red sand", "sand")
+    assert index.search("sand") == [2, 1, 0]
+
+
+def test_case_and_whitespace_are_ignored():
+    index = make_index("Iron Ore")
+    assert index.search("  IRON ore ") == [0]
+    assert index.search("   ") == []
+
+
+def test_typo_falls_back_to_shared_trigrams():
+    index = make_index("obsiden", "diamond")
+    assert index.search("obsidian") == [0]
+
+
+def test_typo_fallback_needs_two_shared_trigrams():
+    index = make_index("abxy", "xbcd")
+    # "abcd" shares only one trigram with either item
+    assert index.search("abcd") == []
+
+
+def test_large_candidate_sets_keep_insertion_order():
+    index = SearchIndex()
+    index.MAX_RANKED = 10
+    for item_id in reversed(range(20)):
+        index.add(item_id, "stone")
+    assert index.search("st", limit=5) == [0, 1, 2, 3, 4]
+
+
+def test_limit():
+    index = make_index(*["sand"] * 10)
+    assert len(index.search("sand", limit=3)) == 3
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PyQt5")
+pytest.importorskip("keyboard")
+
+from PyQt5.QtCore import Qt, QModelIndex  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from todo_overlay import ItemFilterProxy, TodoStore  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def store(app, tmp_path):
+    store = TodoStore(tmp_path / "todo_items.xml")
+    for text in ["Copper", "Coal", "Iron Ore"]:
+        store.add_item(text)
+    return store
+
+
+def texts(store):
+    return [store.model.item(row).text() for row in range(store.model.rowCount())]
+
+
+def test_moved_item_stays_searchable(store):
+    model = store.model
+    # What an internal drag and drop move does: drop a copy, then remove the original
+    data = model.mimeData([model.index(2, 0)])
+    assert model.dropMimeData(data, Qt.MoveAction, 0, 0, QModelIndex())
+    model.removeRow(3)
+
+    assert texts(store) == ["Iron Ore", "Copper", "Coal"]
+    search_index = store.search_index
+    assert len(search_index.index) == 3
+    matches = search_index.index.search("iron ore")
+    assert [search_index.items[item_id].text() for item_id in matches] == ["Iron Ore"]
+
+
+def test_filter_proxy_follows_edits(store):
+    proxy = ItemFilterProxy(store.search_index)
+    proxy.set_filter_text("co")
+    # Equally good matches rank the shorter text first
+    assert [proxy.index(row, 0).data() for row in range(proxy.rowCount())] == ["Coal", "Copper"]
+    assert proxy.mapToSource(proxy.index(1, 0)).row() == 0
+
+    store.model.removeRow(0)
+    store.add_item("Cobblestone")
+    store.model.item(0).setText("Charcoal")
+    results = [proxy.index(row, 0).data() for row in range(proxy.rowCount())]
+    assert results == ["Cobblestone"]
+    assert proxy.mapToSource(proxy.index(0, 0)).row() == 2
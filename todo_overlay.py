@@ -2,56 +2,228 @@ import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                           QListWidget, QPushButton, QLineEdit, QMessageBox, QHBoxLayout, QLabel, QFileDialog, QListWidgetItem)
-from PyQt5.QtCore import Qt, QPoint, QRect
-from PyQt5.QtGui import QPainter, QColor, QPixmap
+                           QPushButton, QLineEdit, QMessageBox, QHBoxLayout, QLabel, QFileDialog, QListView)
+from PyQt5.QtCore import (Qt, QPoint, QRect, QObject, QModelIndex,
+                          QAbstractProxyModel, pyqtSignal)
+from PyQt5.QtGui import QPainter, QColor, QPixmap, QPixmapCache, QStandardItem, QStandardItemModel
 from datetime import datetime
 import keyboard
+from search_index import SearchIndex
 
+ITEM_ID_ROLE = Qt.UserRole + 1  # Stable id of an item in the search index
 
-class DraggableListWidget(QListWidget):
-    def __init__(self, parent=None):
+
+class ItemSearchIndex(QObject):
+    """Keeps a SearchIndex in sync with an item model as rows are added, removed or edited"""
+    changed = pyqtSignal()
+
+    def __init__(self, model, parent=None):
         super().__init__(parent)
-        # Enable drag and drop
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.InternalMove)
-        self.setDefaultDropAction(Qt.MoveAction)
-        
-    def dropEvent(self, event):
-        super().dropEvent(event)
-        # Notify the parent window to save the new order
-        if isinstance(self.parent(), OverlayWindow):
-            self.parent().save_items()
-            
-class OverlayWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.save_file = Path("todo_items.xml")
-        self.initUI()
-        self.setWindowFlags(
-            Qt.FramelessWindowHint | 
-            Qt.WindowStaysOnTopHint | 
-            Qt.Tool
-        )
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.is_visible = True
-        self.resizing = False
-        self.resize_margin = 30
-        
-        keyboard.on_press_key("enter", self.handle_hotkey, suppress=False)
-        keyboard.on_press_key("`", self.close_program, suppress=True)
+        self.model = model
+        self.index = SearchIndex()
+        # Items rather than persistent indexes, which Qt would have to update
+        # on every insert or remove in the middle of the list
+        self.items = {}  # item id -> QStandardItem
+        self.item_ids = {}  # id() of a tracked QStandardItem -> item id
+        self.next_id = 0
+
+        model.rowsInserted.connect(self.on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self.on_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self.changed)
+        model.dataChanged.connect(self.on_data_changed)
+        model.modelReset.connect(self.rebuild)
+
+    def on_rows_inserted(self, parent, first, last):
+        for row in range(first, last + 1):
+            self.sync(self.model.item(row))
+        self.changed.emit()
+
+    def on_rows_about_to_be_removed(self, parent, first, last):
+        for row in range(first, last + 1):
+            self.untrack(self.item_ids.get(id(self.model.item(row))))
+
+    def on_data_changed(self, top_left, bottom_right, roles=()):
+        # Image paths and ids live in other roles and do not affect the text
+        if roles and Qt.DisplayRole not in roles and Qt.EditRole not in roles:
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self.sync(self.model.item(row))
+        self.changed.emit()
+
+    def sync(self, item):
+        """Index the item's current text, giving it a fresh id unless it already owns one"""
+        if item is None:
+            return  # An empty row, a drop sets its item afterwards
+        item_id = item.data(ITEM_ID_ROLE)
+        if self.items.get(item_id) is item:
+            self.index.update(item_id, item.text())
+            return
+        # A drag and drop move first inserts an empty row, then sets the dropped
+        # item there, still carrying the id of the original row it was copied from
+        self.untrack(self.item_ids.get(id(item)))
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = item
+        self.item_ids[id(item)] = item_id
+        self.index.add(item_id, item.text())
+        item.setData(item_id, ITEM_ID_ROLE)
+
+    def untrack(self, item_id):
+        item = self.items.pop(item_id, None)
+        if item is not None:
+            del self.item_ids[id(item)]
+            self.index.remove(item_id)
+
+    def rebuild(self):
+        self.index = SearchIndex()
+        self.items.clear()
+        self.item_ids.clear()
+        if self.model.rowCount() > 0:
+            self.on_rows_inserted(QModelIndex(), 0, self.model.rowCount() - 1)
+        else:
+            self.changed.emit()
+
+
+class ItemFilterProxy(QAbstractProxyModel):
+    """Read-only view of the source items that match the current filter text, best match first"""
+    RESULT_LIMIT = 200  # Far more than fit on screen, fewer rows for the view to lay out
+
+    def __init__(self, search_index, parent=None):
+        super().__init__(parent)
+        self.search_index = search_index
+        self.query = ""
+        self.matches = []  # proxy row -> item id
+        self.match_rows = {}  # item id -> proxy row
+        self.sources = []  # proxy row -> source index, resolved once per refresh
+        self.setSourceModel(search_index.model)
+        search_index.changed.connect(self.refresh)
+
+    def set_filter_text(self, text):
+        self.query = text.strip()
+        self.refresh()
+
+    def refresh(self):
+        """Re-run the query against the index, only touching the matching items"""
+        if not self.query and not self.matches:
+            return
+        self.beginResetModel()
+        self.matches = self.search_index.index.search(self.query, self.RESULT_LIMIT)
+        self.match_rows = {item_id: row for row, item_id in enumerate(self.matches)}
+        items = self.search_index.items
+        self.sources = [items[item_id].index() for item_id in self.matches]
+        self.endResetModel()
+
+    def mapToSource(self, proxy_index):
+        # Called for every data() lookup, so only return what refresh() resolved.
+        # Any insert, remove or edit in the source triggers a refresh first.
+        if not proxy_index.isValid() or proxy_index.row() >= len(self.sources):
+            return QModelIndex()
+        return self.sources[proxy_index.row()]
+
+    def mapFromSource(self, source_index):
+        row = self.match_rows.get(source_index.data(ITEM_ID_ROLE))
+        if row is None:
+            return QModelIndex()
+        return self.index(row, 0)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not 0 <= row < len(self.matches) or column != 0:
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        # Without an index this is QObject.parent()
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.matches)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+
+LIST_STYLE = """
+    QListView {
+        background-color: rgba(40, 40, 40, 180);
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QListView::item {
+        background-color: rgba(60, 60, 60, 180);
+        border-radius: 3px;
+        margin: 2px;
+        padding: 4px;
+    }
+    QListView::item:selected {
+        background-color: rgba(70, 130, 180, 180);
+    }
+    QListView::item:hover {
+        background-color: rgba(80, 80, 80, 180);
+    }
+"""
+
+
+def load_scaled_pixmap(image_path, size, device_pixel_ratio):
+    """Load an image scaled to fit size on a screen with the given device pixel ratio.
+    
+    Decoded images and each scaled copy are kept in the shared QPixmapCache, so
+    windows on different screens reuse one decode and each gets a crisp copy.
+    """
+    try:
+        # Include the modification time so a replaced file is not served stale
+        source_key = f"{image_path}|{Path(image_path).stat().st_mtime_ns}"
+    except OSError:
+        return QPixmap()
+    width = round(size.width() * device_pixel_ratio)
+    height = round(size.height() * device_pixel_ratio)
+    scaled_key = f"{source_key}|{width}x{height}@{device_pixel_ratio}"
+    
+    pixmap = QPixmapCache.find(scaled_key)
+    if pixmap is None:
+        source = QPixmapCache.find(source_key)
+        if source is None:
+            source = QPixmap(image_path)
+            if source.isNull():
+                return source
+            QPixmapCache.insert(source_key, source)
+        pixmap = source.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        QPixmapCache.insert(scaled_key, pixmap)
+    return pixmap
+
+
+class TodoStore(QObject):
+    """Item model shared by every overlay window, loaded and saved in one place"""
+    def __init__(self, save_file, parent=None):
+        super().__init__(parent)
+        self.save_file = save_file
+        self.model = QStandardItemModel(self)
+        # Items dropped back into the list must not accept drops themselves,
+        # otherwise a drop onto an item would nest it as a child
+        prototype = QStandardItem()
+        prototype.setDropEnabled(False)
+        self.model.setItemPrototype(prototype)
+        self.search_index = ItemSearchIndex(self.model, self)
         
-        # Load saved items
-        self.load_items()
+    def add_item(self, text, image_path=None):
+        item = QStandardItem(text)
+        item.setDropEnabled(False)
+        if image_path:
+            item.setData(image_path, Qt.UserRole)
+        self.model.appendRow(item)
+        return item
         
-    def save_items(self):
+    def save(self):
         """Save todo items and image paths to XML file"""
         root = ET.Element("todo_list")
         
-        for i in range(self.todo_list.count()):
+        for i in range(self.model.rowCount()):
             item = ET.SubElement(root, "item")
-            list_item = self.todo_list.item(i)
+            list_item = self.model.item(i)
             # Save text
             text = ET.SubElement(item, "text")
             text.text = list_item.text()
@@ -70,7 +242,7 @@ class OverlayWindow(QMainWindow):
         ET.indent(tree, space="  ")
         tree.write(self.save_file, encoding="utf-8", xml_declaration=True)
 
-    def load_items(self):
+    def load(self):
         """Load todo items and image paths from XML file"""
         if not self.save_file.exists():
             return
@@ -84,22 +256,66 @@ class OverlayWindow(QMainWindow):
                 image_elem = item.find("image")
                 
                 if text_elem is not None and text_elem.text:
-                    list_item = QListWidgetItem(text_elem.text)
+                    image_path = None
                     if image_elem is not None and image_elem.text:
-                        # Store the image path in the item's data
-                        image_path = image_elem.text
-                        if Path(image_path).exists():  # Verify image file exists
-                            list_item.setData(Qt.UserRole, image_path)
-                    self.todo_list.addItem(list_item)
-                    
-            # If there are items, select the first one to show its image
-            if self.todo_list.count() > 0:
-                self.todo_list.setCurrentRow(0)
-                self.on_item_selected()
+                        if Path(image_elem.text).exists():  # Verify image file exists
+                            image_path = image_elem.text
+                    self.add_item(text_elem.text, image_path)
                 
         except ET.ParseError:
-            QMessageBox.warning(self, "Load Error", 
+            QMessageBox.warning(None, "Load Error", 
                             "Could not load saved items.")
+
+
+class DraggableListView(QListView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Enable drag and drop
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDragDropMode(QListView.InternalMove)
+        self.setDefaultDropAction(Qt.MoveAction)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        
+    def startDrag(self, supported_actions):
+        super().startDrag(supported_actions)
+        # The moved row is only removed from its old position once the drag
+        # finishes, so save the new order here rather than in dropEvent
+        window = self.window()
+        if isinstance(window, OverlayWindow):
+            window.store.save()
+            
+class OverlayWindow(QMainWindow):
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self.initUI()
+        self.setWindowFlags(
+            Qt.FramelessWindowHint | 
+            Qt.WindowStaysOnTopHint | 
+            Qt.Tool
+        )
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.is_visible = True
+        self.resizing = False
+        self.resize_margin = 30
+        
+        # Re-render the image at the new pixel ratio when moved to another monitor
+        self.winId()
+        self.windowHandle().screenChanged.connect(lambda screen: self.on_item_selected())
+        
+        keyboard.on_press_key("enter", self.handle_hotkey, suppress=False)
+        
+        # If there are items, select the first one to show its image
+        if self.store.model.rowCount() > 0:
+            self.todo_list.setCurrentIndex(self.store.model.index(0, 0))
+            self.on_item_selected()
+        
+    def current_item(self):
+        index = self.todo_list.currentIndex()
+        if not index.isValid():
+            return None
+        return self.store.model.itemFromIndex(index)
         
     def initUI(self):
         # Main widget and layout setup
@@ -127,29 +343,34 @@ class OverlayWindow(QMainWindow):
                 }
             """)
         
-        # Replace QListWidget with DraggableListWidget
-        self.todo_list = DraggableListWidget()
-        self.todo_list.setStyleSheet("""
-            QListWidget {
+        # Every window shows the same shared model
+        self.todo_list = DraggableListView()
+        self.todo_list.setModel(self.store.model)
+        self.todo_list.setStyleSheet(LIST_STYLE)
+        
+        # Filter field and the results list shown while it has text
+        self.filter_proxy = ItemFilterProxy(self.store.search_index, self)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter items (Ctrl+F)")
+        self.filter_input.setStyleSheet("""
+            QLineEdit {
                 background-color: rgba(40, 40, 40, 180);
                 color: white;
                 border: none;
                 border-radius: 5px;
                 padding: 5px;
             }
-            QListWidget::item {
-                background-color: rgba(60, 60, 60, 180);
-                border-radius: 3px;
-                margin: 2px;
-                padding: 4px;
-            }
-            QListWidget::item:selected {
-                background-color: rgba(70, 130, 180, 180);
-            }
-            QListWidget::item:hover {
-                background-color: rgba(80, 80, 80, 180);
-            }
         """)
+        self.filter_input.textChanged.connect(self.apply_filter)
+        
+        self.filter_view = QListView()
+        self.filter_view.setModel(self.filter_proxy)
+        self.filter_view.setEditTriggers(QListView.NoEditTriggers)
+        self.filter_view.setUniformItemSizes(True)  # Skip measuring every result on each keystroke
+        self.filter_view.setStyleSheet(LIST_STYLE)
+        self.filter_view.selectionModel().currentChanged.connect(self.on_filter_result_selected)
+        self.filter_proxy.modelReset.connect(self.on_filter_results_reset)
+        self.filter_view.hide()
         
         # Input field
         self.item_input = QLineEdit()
@@ -206,10 +427,15 @@ class OverlayWindow(QMainWindow):
         self.delete_button.clicked.connect(self.delete_selected_item)
         self.upload_image_button.clicked.connect(self.upload_image)
         self.clear_image_button.clicked.connect(self.clear_image)
-        self.todo_list.itemSelectionChanged.connect(self.on_item_selected)
+        self.todo_list.selectionModel().currentChanged.connect(
+            lambda current, previous: self.on_item_selected())
+        # Edits made from another window change the image shown here too
+        self.store.model.dataChanged.connect(self.on_model_data_changed)
         
         # Populate left panel
+        self.left_layout.addWidget(self.filter_input)
         self.left_layout.addWidget(self.todo_list)
+        self.left_layout.addWidget(self.filter_view)
         self.left_layout.addWidget(self.item_input)
         self.left_layout.addWidget(self.add_button)
         self.left_layout.addWidget(self.delete_button)
@@ -245,6 +471,8 @@ class OverlayWindow(QMainWindow):
     
     def show_image_panel(self, show=True):
         """Show or hide the image panel"""
+        if show != self.right_panel.isHidden():
+            return  # Already in that state, keep the size the user gave the window
         if show:
             self.right_panel.show()
             self.update_window_size(True)
@@ -253,7 +481,7 @@ class OverlayWindow(QMainWindow):
             self.update_window_size(False)
             
     def upload_image(self, from_clipboard=False):
-        current_item = self.todo_list.currentItem()
+        current_item = self.current_item()
         if not current_item:
             QMessageBox.warning(self, "No Selection", 
                             "Please select a todo item first.")
@@ -272,6 +500,13 @@ class OverlayWindow(QMainWindow):
                                 "No image found in clipboard.")
                 print("No image found in clipboard")  # Debug print
                 return
+                
+            # Add error checking for pixmap
+            if pixmap.isNull():
+                QMessageBox.warning(self, "Error", 
+                                "Failed to load image from clipboard.")
+                print("Failed to create pixmap from clipboard image")  # Debug print
+                return
         else:
             file_path, _ = QFileDialog.getOpenFileName(
                 self, 
@@ -281,23 +516,8 @@ class OverlayWindow(QMainWindow):
             )
             if not file_path:
                 return
-            pixmap = QPixmap(file_path)
-
-        # Add error checking for pixmap
-        if pixmap.isNull():
-            QMessageBox.warning(self, "Error", 
-                            "Failed to load image from clipboard.")
-            print("Failed to create pixmap from clipboard image")  # Debug print
-            return
 
         try:
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.size(), 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
-            
             if from_clipboard:
                 # Create images directory if it doesn't exist
                 save_dir = Path("images")
@@ -312,10 +532,22 @@ class OverlayWindow(QMainWindow):
                 else:
                     print(f"Failed to save clipboard image to: {file_path}")
                     return
+            
+            # Decoded once into the shared cache, other windows reuse it
+            scaled_pixmap = load_scaled_pixmap(
+                str(file_path),
+                self.image_label.size(),
+                self.devicePixelRatioF()
+            )
+            if scaled_pixmap.isNull():
+                QMessageBox.warning(self, "Error", 
+                                "Failed to load image.")
+                return
+            self.image_label.setPixmap(scaled_pixmap)
                     
-            current_item.setData(Qt.UserRole, str(file_path))
+            current_item.setData(str(file_path), Qt.UserRole)
             self.show_image_panel(True)
-            self.save_items()
+            self.store.save()
             
         except Exception as e:
             print(f"Error processing image: {str(e)}")
@@ -327,11 +559,18 @@ class OverlayWindow(QMainWindow):
         if event.key() == Qt.Key_V and event.modifiers() == Qt.ControlModifier:
             self.upload_image(from_clipboard=True)
             event.accept()
+        elif event.key() == Qt.Key_F and event.modifiers() == Qt.ControlModifier:
+            self.filter_input.setFocus()
+            self.filter_input.selectAll()
+            event.accept()
+        elif event.key() == Qt.Key_Escape and self.filter_input.text():
+            self.filter_input.clear()
+            event.accept()
         else:
             super().keyPressEvent(event)
             
     def clear_image(self):
-        current_item = self.todo_list.currentItem()
+        current_item = self.current_item()
         if current_item:
             # Get the image path before clearing the data
             image_path = current_item.data(Qt.UserRole)
@@ -346,21 +585,58 @@ class OverlayWindow(QMainWindow):
                 except Exception as e:
                     print(f"Error deleting image file: {e}")
             
-            current_item.setData(Qt.UserRole, None)
+            current_item.setData(None, Qt.UserRole)
             self.image_label.clear()
             self.show_image_panel(False)
-            self.save_items()
+            self.store.save()
+
+    def apply_filter(self, text):
+        """Swap the full list for the filtered results while there is filter text"""
+        self.filter_proxy.set_filter_text(text)
+        filtering = bool(text.strip())
+        self.todo_list.setVisible(not filtering)
+        self.filter_view.setVisible(filtering)
+        self.clear_selection()
+    
+    def on_filter_results_reset(self):
+        # The results were rebuilt (new text or items changed in any window),
+        # so whatever was selected may no longer be on screen
+        if self.filter_input.text().strip():
+            self.clear_selection()
+    
+    def clear_selection(self):
+        """Deselect the list so the buttons never act on an item that is not shown"""
+        selection = self.todo_list.selectionModel()
+        if not selection.hasSelection() and not selection.currentIndex().isValid():
+            return
+        # Hide the panel in place first so the window keeps its size while typing
+        self.image_label.clear()
+        self.right_panel.hide()
+        selection.clear()
+    
+    def on_filter_result_selected(self, current, previous):
+        # Select the matching item in the full list so the other buttons act on it
+        source = self.filter_proxy.mapToSource(current)
+        if source.isValid():
+            self.todo_list.setCurrentIndex(source)
+
+    def on_model_data_changed(self, top_left, bottom_right, roles=()):
+        # Only an image change on the item shown here needs a redraw
+        if roles and Qt.UserRole not in roles:
+            return
+        row = self.todo_list.currentIndex().row()
+        if top_left.row() <= row <= bottom_right.row():
+            self.on_item_selected()
 
     def on_item_selected(self):
-        current_item = self.todo_list.currentItem()
+        current_item = self.current_item()
         if current_item:
             image_path = current_item.data(Qt.UserRole)
             if image_path and Path(image_path).exists():
-                pixmap = QPixmap(image_path)
-                scaled_pixmap = pixmap.scaled(
+                scaled_pixmap = load_scaled_pixmap(
+                    image_path,
                     self.image_label.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
+                    self.devicePixelRatioF()
                 )
                 self.image_label.setPixmap(scaled_pixmap)
                 self.show_image_panel(True)
@@ -389,17 +665,20 @@ class OverlayWindow(QMainWindow):
     def add_item(self):
         text = self.item_input.text().strip()
         if text:
-            self.todo_list.addItem(text)
+            self.store.add_item(text)
             self.item_input.clear()
-            self.save_items()  # Save after adding
+            self.store.save()  # Save after adding
             
     def delete_selected_item(self):
-        selected_items = self.todo_list.selectedItems()
-        if not selected_items:
+        # Delete from the bottom up so the remaining rows keep their numbers
+        selected_rows = sorted((index.row() for index in self.todo_list.selectedIndexes()),
+                               reverse=True)
+        if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select an item to delete.")
             return
         
-        for item in selected_items:
+        for row in selected_rows:
+            item = self.store.model.item(row)
             # Clean up associated image before deleting the item
             image_path = item.data(Qt.UserRole)
             if image_path:
@@ -413,10 +692,9 @@ class OverlayWindow(QMainWindow):
                     print(f"Error deleting image file: {e}")
             
             # Remove the item from the list
-            row = self.todo_list.row(item)
-            self.todo_list.takeItem(row)
+            self.store.model.removeRow(row)
         
-        self.save_items()
+        self.store.save()
     
     def handle_hotkey(self, e):
         if keyboard.is_pressed('shift'):
@@ -459,14 +737,35 @@ class OverlayWindow(QMainWindow):
                 self.setCursor(Qt.ArrowCursor)
     
     def close_program(self, e):
-        self.save_items()  # Save items before closing
+        self.store.save()  # Save items before closing
         keyboard.unhook_all()
         QApplication.quit()
         
     def main():
+        # Render at each monitor's real pixel density instead of upscaling.
+        # PassThrough keeps fractional scales such as 125% and 150% instead of
+        # rounding them to whole device pixel ratios
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+        QApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
         app = QApplication(sys.argv)
-        overlay = OverlayWindow()
-        overlay.show()
+        QPixmapCache.setCacheLimit(64 * 1024)  # In KB, room for a few full size screenshots
+        
+        # Items are loaded once and shared by every window
+        store = TodoStore(Path("todo_items.xml"))
+        store.load()
+        
+        # One overlay per monitor
+        overlays = []
+        for screen in app.screens():
+            overlay = OverlayWindow(store)
+            overlay.move(screen.availableGeometry().center() - overlay.rect().center())
+            overlay.show()
+            overlays.append(overlay)
+        
+        # Registered once so closing saves a single time
+        keyboard.on_press_key("`", overlays[0].close_program, suppress=True)
         sys.exit(app.exec_())
 
 if __name__ == '__main__':